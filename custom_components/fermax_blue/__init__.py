@@ -1,33 +1,93 @@
 """The Fermax Blue integration."""
 import asyncio
 import logging
+import random
 from datetime import timedelta, datetime, timezone
-import json
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.storage import Store
+from homeassistant.util.ssl import client_context
 
-from .const import DOMAIN, CONF_EMAIL, CONF_PASSWORD
+from .const import (
+    DOMAIN,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    DEFAULT_SCAN_INTERVAL,
+    SCAN_INTERVAL_JITTER,
+)
+from .fermax_api import FermaxBlueAuthError
 from .fermax_integration import FermaxBlueIntegration
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.BUTTON]
 
+TOKEN_STORE_KEY = "_token_store"
+TOKEN_SAVE_DELAY = 10  # seconds
+
+SESSION_KEY = "_session"
+SESSION_UNSUB_KEY = "_session_unsub"
+SHARED_KEYS = (TOKEN_STORE_KEY, SESSION_KEY, SESSION_UNSUB_KEY)
+# Calls only go to the Fermax OAuth and API hosts; keep a few connections warm
+CONNECTION_LIMIT = 10
+CONNECTION_LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 300  # seconds
+DNS_CACHE_TTL = 600  # seconds
+
+
+def _async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the HTTP session shared by every config entry.
+
+    Never create a session per entry; all clients must reuse this pool.
+    """
+    session = hass.data[DOMAIN].get(SESSION_KEY)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                # Home Assistant's cached client context; no CA bundle load per session
+                ssl=client_context(),
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            ),
+            headers={"Connection": "keep-alive"},
+        )
+        hass.data[DOMAIN][SESSION_KEY] = session
+
+        async def _async_close_session(event: Event) -> None:
+            hass.data[DOMAIN].pop(SESSION_UNSUB_KEY, None)
+            await session.close()
+
+        hass.data[DOMAIN][SESSION_UNSUB_KEY] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    return session
+
+
+def _async_get_token_store(hass: HomeAssistant) -> "FermaxBlueTokenStore":
+    """Return the token store shared by every config entry."""
+    if TOKEN_STORE_KEY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][TOKEN_STORE_KEY] = FermaxBlueTokenStore(hass)
+    return hass.data[DOMAIN][TOKEN_STORE_KEY]
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Fermax Blue from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    # One token file shared by every config entry
+    token_store = _async_get_token_store(hass)
+    
     # Create integration instance
-    session = async_get_clientsession(hass)
+    session = _async_get_session(hass)
     
     integration = FermaxBlueIntegration(
         username=entry.data[CONF_EMAIL],
@@ -36,7 +96,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     
     # Create coordinator with storage
-    coordinator = FermaxBlueCoordinator(hass, integration, entry.entry_id)
+    scan_interval = timedelta(
+        minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    coordinator = FermaxBlueCoordinator(
+        hass,
+        integration,
+        entry.entry_id,
+        scan_interval,
+        token_store,
+    )
     
     # Load stored tokens before first refresh
     await coordinator.load_tokens()
@@ -50,54 +119,162 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Reload when the polling interval is changed from the options flow
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        
+        # Close the shared session once the last entry is gone
+        if not any(key not in SHARED_KEYS for key in hass.data[DOMAIN]):
+            if unsub := hass.data[DOMAIN].pop(SESSION_UNSUB_KEY, None):
+                unsub()
+            if session := hass.data[DOMAIN].pop(SESSION_KEY, None):
+                await session.close()
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored tokens of a removed config entry."""
+    hass.data.setdefault(DOMAIN, {})
+    await _async_get_token_store(hass).async_remove(entry.entry_id)
+
+
+class FermaxBlueTokenStore:
+    """Token storage shared by all Fermax Blue config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the token store."""
+        self._hass = hass
+        self._store = Store(hass, 1, f"{DOMAIN}.tokens")
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = asyncio.Lock()
+
+    def _legacy_store(self, entry_id: str) -> Store:
+        """Return the per-entry store used before tokens were shared."""
+        return Store(self._hass, 1, f"{DOMAIN}.{entry_id}.tokens")
+
+    async def _async_ensure_loaded(self) -> Dict[str, Dict[str, Any]]:
+        """Load the shared file on first use (caller holds the lock)."""
+        if self._data is None:
+            self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_load(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored tokens for a config entry."""
+        async with self._lock:
+            data = await self._async_ensure_loaded()
+            if entry_id not in data:
+                # Move tokens from the old per-entry file so no copy is left behind
+                legacy = self._legacy_store(entry_id)
+                if tokens := await legacy.async_load():
+                    data[entry_id] = tokens
+                    await self._store.async_save(data)
+                    await legacy.async_remove()
+                    _LOGGER.debug("Migrated stored tokens for entry %s", entry_id)
+        return data.get(entry_id)
+
+    async def async_save(self, entry_id: str, tokens: Dict[str, Any]) -> None:
+        """Update the tokens for a config entry and schedule a write."""
+        async with self._lock:
+            data = await self._async_ensure_loaded()
+            data[entry_id] = tokens
+        # Saves from all entries within the delay are coalesced into one disk write
+        self._store.async_delay_save(lambda: self._data, TOKEN_SAVE_DELAY)
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Drop the tokens of a config entry, including any legacy file."""
+        async with self._lock:
+            data = await self._async_ensure_loaded()
+            if data.pop(entry_id, None) is not None:
+                await self._store.async_save(data)
+            await self._legacy_store(entry_id).async_remove()
+
+
 class FermaxBlueCoordinator(DataUpdateCoordinator):
     """Fermax Blue data coordinator."""
 
-    def __init__(self, hass: HomeAssistant, integration: FermaxBlueIntegration, entry_id: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        integration: FermaxBlueIntegration,
+        entry_id: str,
+        update_interval: timedelta,
+        token_store: FermaxBlueTokenStore,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=15),  # Reduced from 30 to 15 minutes
+            update_interval=update_interval,
+            # Pairings rarely change; skip listener callbacks when data is equal
+            always_update=False,
         )
         self.integration = integration
-        self._home_device_info: DeviceInfo | None = None
+        self._base_update_interval = update_interval
         self.entry_id = entry_id
-        self._store = Store(hass, 1, f"{DOMAIN}.{entry_id}.tokens")
+        self._token_store = token_store
+        self._last_saved_token_sig: tuple | None = None
+
+    def _token_signature(self) -> tuple:
+        """Return the token state that is persisted to storage."""
+        return (
+            self.integration.access_token,
+            self.integration.refresh_token,
+            self.integration.token_expires_at,
+        )
 
     async def load_tokens(self) -> None:
         """Load stored tokens."""
         try:
-            data = await self._store.async_load()
+            data = await self._token_store.async_load(self.entry_id)
             if data:
                 self.integration.access_token = data.get("access_token")
                 self.integration.refresh_token = data.get("refresh_token")
                 
-                # Parse token expiration
-                expires_at_str = data.get("token_expires_at")
-                if expires_at_str:
-                    self.integration.token_expires_at = datetime.fromisoformat(expires_at_str)
-                    _LOGGER.debug(f"Loaded stored tokens, expires at {self.integration.token_expires_at}")
+                # Parse token expiration (epoch seconds; ISO strings from older releases)
+                expires_at_ts = data.get("token_expires_at")
+                legacy_format = isinstance(expires_at_ts, str)
+                if legacy_format:
+                    try:
+                        expires_at = datetime.fromisoformat(expires_at_ts)
+                    except ValueError:
+                        expires_at = None
+                        _LOGGER.debug("Unparseable stored token expiration: %s", expires_at_ts)
+                    if expires_at is not None and expires_at.tzinfo is None:
+                        expires_at = expires_at.replace(tzinfo=timezone.utc)
+                elif isinstance(expires_at_ts, (int, float)):
+                    expires_at = datetime.fromtimestamp(expires_at_ts, tz=timezone.utc)
+                else:
+                    expires_at = None
+                
+                if expires_at is not None:
+                    self.integration.token_expires_at = expires_at
+                    _LOGGER.debug("Loaded stored tokens, expires at %s", self.integration.token_expires_at)
                     
                     # Check if token is still valid
                     if self.integration._needs_refresh():
                         _LOGGER.info("Stored token expired or expiring soon, will refresh")
-                else:
+                elif not legacy_format:
                     _LOGGER.debug("No token expiration in stored data")
+                
+                # Leave ISO-format data unmarked so the next update rewrites it as epoch seconds
+                if not legacy_format:
+                    self._last_saved_token_sig = self._token_signature()
         except Exception as err:
-            _LOGGER.error(f"Error loading stored tokens: {err}")
+            _LOGGER.error("Error loading stored tokens: %s", err)
 
     async def save_tokens(self) -> None:
         """Save tokens to storage."""
@@ -105,45 +282,73 @@ class FermaxBlueCoordinator(DataUpdateCoordinator):
             data = {
                 "access_token": self.integration.access_token,
                 "refresh_token": self.integration.refresh_token,
-                "token_expires_at": self.integration.token_expires_at.isoformat() if self.integration.token_expires_at else None,
+                "token_expires_at": int(self.integration.token_expires_at.timestamp()) if self.integration.token_expires_at else None,
             }
-            await self._store.async_save(data)
+            await self._token_store.async_save(self.entry_id, data)
+            self._last_saved_token_sig = self._token_signature()
             _LOGGER.debug("Tokens saved to storage")
         except Exception as err:
-            _LOGGER.error(f"Error saving tokens: {err}")
+            _LOGGER.error("Error saving tokens: %s", err)
+
+    async def save_tokens_if_changed(self) -> None:
+        """Save tokens only if they changed since the last save or load."""
+        if self._token_signature() != self._last_saved_token_sig:
+            await self.save_tokens()
+
+    async def _async_authenticate(self) -> bool:
+        """Renew the token if needed through the client's single-flight auth.
+
+        Only rejected credentials return False; connection errors propagate.
+        """
+        try:
+            return await self.integration.ensure_auth()
+        except FermaxBlueAuthError as err:
+            _LOGGER.warning("Authentication failed: %s", err)
+            return False
+
+    async def ensure_authenticated(self) -> bool:
+        """Ensure the token is valid and persist it if it was refreshed."""
+        if not await self._async_authenticate():
+            return False
+        
+        await self.save_tokens_if_changed()
+        return True
 
     async def _async_update_data(self):
         """Update data via library."""
+        # Jitter the next poll so restarted instances don't hit Fermax together
+        self.update_interval = self._base_update_interval + timedelta(
+            seconds=random.randint(0, SCAN_INTERVAL_JITTER)
+        )
+        
         try:
             # Ensure authentication is current before updating
-            if self.integration._needs_refresh():
-                _LOGGER.info("Token needs refresh during coordinator update")
-                if not await self.integration.authenticate():
-                    raise UpdateFailed("Failed to authenticate")
-                # Save new tokens after successful auth
-                await self.save_tokens()
+            if not await self._async_authenticate():
+                raise UpdateFailed("Failed to authenticate")
             
             # Update pairings data
             await self.integration.update_data()
             
-            # Save tokens after successful update (in case they were refreshed)
-            await self.save_tokens()
+            # Single write per cycle covers both the auth above and any re-auth during the fetch
+            await self.save_tokens_if_changed()
             
-            return self.integration.pairings
+            # Stable ordering so unchanged pairings compare equal between polls
+            return sorted(
+                self.integration.pairings,
+                key=lambda pairing: pairing.get("deviceId") or "",
+            )
         except Exception as err:
-            _LOGGER.error(f"Coordinator update error: {err}")
+            _LOGGER.error("Coordinator update error: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}")
 
-    @property
+    @cached_property
     def home_device_info(self) -> DeviceInfo:
         """Return home device info."""
-        if self._home_device_info is None:
-            home_info = self.integration.get_home_info()
-            self._home_device_info = DeviceInfo(
-                identifiers={(DOMAIN, home_info.get("id", "unknown"))},
-                name=home_info.get("name", "Fermax Blue Home"),
-                manufacturer="Fermax",
-                model="Blue Intercom System",
-                sw_version="1.0",
-            )
-        return self._home_device_info
\ No newline at end of file
+        home_info = self.integration.get_home_info()
+        return DeviceInfo(
+            identifiers={(DOMAIN, home_info.get("id", "unknown"))},
+            name=home_info.get("name", "Fermax Blue Home"),
+            manufacturer="Fermax",
+            model="Blue Intercom System",
+            sw_version="1.0",
+        )
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Button platform for Fermax Blue integration."""
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -8,8 +8,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import FermaxBlueCoordinator
 from .const import DOMAIN, ENTITY_OPEN_DOOR
+from .fermax_api import FermaxBlueAuthError
 from .fermax_integration import FermaxBlueIntegration
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,105 +24,147 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Fermax Blue button entities based on a config entry."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: FermaxBlueCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     integration: FermaxBlueIntegration = coordinator.integration
     
-    entities = []
-    
     # Get door devices and create button entities
-    door_devices = integration.get_door_devices()
+    door_devices = tuple(integration.get_door_devices())
     home_info = integration.get_home_info()
+    via_device = (DOMAIN, home_info.get("id", "unknown"))
+    name_suffix = " " + ENTITY_OPEN_DOOR
+    entry_id = config_entry.entry_id
     
+    # Doors on the same intercom share a single DeviceInfo
+    device_infos: Dict[str, DeviceInfo] = {}
     for door in door_devices:
-        entities.append(
-            FermaxBlueDoorButton(
-                integration=integration,
-                door_data=door,
-                home_info=home_info,
-                config_entry=config_entry,
-            )
+        if door["device_id"] not in device_infos:
+            device_infos[door["device_id"]] = _build_device_info(door, via_device)
+    
+    # The device name is prepended by Home Assistant (has_entity_name)
+    entities = [
+        FermaxBlueDoorButton(
+            coordinator=coordinator,
+            door_data=door,
+            device_info=device_infos[door["device_id"]],
+            name=door["door_name"] + name_suffix,
+            unique_id=f"{entry_id}_{door['id']}_open",
         )
+        for door in door_devices
+    ]
     
     async_add_entities(entities)
 
 
-class FermaxBlueDoorButton(ButtonEntity):
+def _build_device_info(door: Dict[str, Any], via_device: Tuple[str, str]) -> DeviceInfo:
+    """Build device info for the intercom a door belongs to."""
+    # Device info - usar el device_name para el dispositivo
+    device_name = door.get("device_name", "Telefonillo")
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{door['device_id']}_{device_name}")},
+        name=device_name,
+        manufacturer="Fermax",
+        model="Blue Intercom",
+        via_device=via_device,
+    )
+
+
+class FermaxBlueDoorButton(CoordinatorEntity[FermaxBlueCoordinator], ButtonEntity):
     """Fermax Blue door button entity."""
 
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:door-open"
+
     def __init__(
         self,
-        integration: FermaxBlueIntegration,
+        coordinator: FermaxBlueCoordinator,
         door_data: Dict[str, Any],
-        home_info: Dict[str, Any],
-        config_entry: ConfigEntry,
+        device_info: DeviceInfo,
+        name: str,
+        unique_id: str,
     ) -> None:
         """Initialize the button entity."""
-        self._integration = integration
+        super().__init__(coordinator)
+        self._open_door = coordinator.integration.open_door
         self._door_data = door_data
-        self._home_info = home_info
-        self._config_entry = config_entry
         
         # Entity attributes
-        self._attr_name = f"{door_data['name']} {ENTITY_OPEN_DOOR}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{door_data['id']}_open"
-        self._attr_icon = "mdi:door-open"
-        
-        # Device info - usar el device_name para el dispositivo
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{door_data['device_id']}_{door_data.get('device_name', 'Telefonillo')}")},
-            name=door_data.get("device_name", "Telefonillo"),
-            manufacturer="Fermax",
-            model="Blue Intercom",
-            via_device=(DOMAIN, home_info.get("id", "unknown")),
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
+
+    @property
+    def available(self) -> bool:
+        """Return True while the door can be pressed.
+
+        A failed poll does not block presses: async_press re-authenticates
+        on its own, and the next poll may be hours away. Buttons are only
+        unavailable when no token has ever been obtained and the last
+        update failed.
+        """
+        return (
+            self.coordinator.integration.access_token is not None
+            or self.coordinator.last_update_success
         )
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        door = self._door_data
+        name = door["name"]
+        
         try:
             # Access ID is already an AccessId object in door_data
-            access_id = self._door_data["access_id"]
+            access_id = door["access_id"]
             
-            _LOGGER.debug(f"Attempting to open door {self._door_data['name']}")
+            _LOGGER.debug("Attempting to open door %s", name)
             
-            success = await self._integration.open_door(
-                device_id=self._door_data["device_id"],
+            # The client's auth lock makes concurrent presses authenticate once;
+            # False means rejected credentials, network errors raise instead
+            if not await self.coordinator.ensure_authenticated():
+                raise HomeAssistantError(
+                    f"Error de autenticación al abrir la puerta. "
+                    f"Por favor, reconfigure la integración con sus credenciales."
+                )
+            
+            success = await self._open_door(
+                device_id=door["device_id"],
                 access_id=access_id,
             )
             
+            # Persist the token if open_door had to re-authenticate after a 401
+            await self.coordinator.save_tokens_if_changed()
+            
             if success:
-                _LOGGER.info(f"Door {self._door_data['name']} opened successfully")
+                _LOGGER.info("Door %s opened successfully", name)
             else:
-                _LOGGER.error(f"Failed to open door {self._door_data['name']} - API returned failure")
+                _LOGGER.error("Failed to open door %s - API returned failure", name)
                 raise HomeAssistantError(
-                    f"No se pudo abrir la puerta {self._door_data['name']}. "
+                    f"No se pudo abrir la puerta {name}. "
                     f"Por favor, verifique la conexión con el servidor Fermax."
                 )
                 
         except HomeAssistantError:
             raise
+        except FermaxBlueAuthError as err:
+            _LOGGER.error("Authentication failed opening door %s: %s", name, err)
+            raise HomeAssistantError(
+                f"Error de autenticación al abrir la puerta. "
+                f"Por favor, reconfigure la integración con sus credenciales."
+            ) from err
         except Exception as err:
-            _LOGGER.error(f"Error opening door {self._door_data['name']}: {type(err).__name__}: {err}")
+            _LOGGER.error("Error opening door %s: %s: %s", name, type(err).__name__, err)
             
-            # Provide user-friendly error messages
-            if "auth" in str(err).lower():
-                raise HomeAssistantError(
-                    f"Error de autenticación al abrir la puerta. "
-                    f"Por favor, reconfigure la integración con sus credenciales."
-                )
-            elif "timeout" in str(err).lower():
+            # Provide user-friendly error messages; auth errors are typed above,
+            # since connection errors name the oauth host and would match "auth"
+            message = str(err).lower()
+            if "timeout" in message or "timed out" in message:
                 raise HomeAssistantError(
                     f"Tiempo de espera agotado al intentar abrir la puerta. "
                     f"Verifique su conexión a internet."
                 )
-            elif "connect" in str(err).lower():
+            elif "connect" in message:
                 raise HomeAssistantError(
                     f"No se pudo conectar con el servidor Fermax. "
                     f"Verifique su conexión a internet o intente más tarde."
                 )
             else:
-                raise HomeAssistantError(f"Error al abrir la puerta: {err}")
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._integration.access_token is not None
\ No newline at end of file
+                raise HomeAssistantError(f"Error al abrir la puerta: {err}")
\ No newline at end of file
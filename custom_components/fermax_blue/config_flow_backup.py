@@ -1,6 +1,5 @@
 """Config flow for Fermax Blue integration."""
 import logging
-import ssl
 from typing import Any, Dict, Optional
 
 import voluptuous as vol
@@ -8,7 +7,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,23 +21,6 @@ from .const import (
     ERROR_UNKNOWN,
 )
 
-try:
-    from .fermax_api import FermaxBlueAPI, FermaxBlueAuthError, FermaxBlueConnectionError
-except ImportError as e:
-    _LOGGER.error(f"Failed to import fermax_api: {e}")
-    # Create dummy classes to prevent crashes
-    class FermaxBlueAPI:
-        def __init__(self, *args, **kwargs):
-            pass
-        async def authenticate(self):
-            return False
-    
-    class FermaxBlueAuthError(Exception):
-        pass
-    
-    class FermaxBlueConnectionError(Exception):
-        pass
-
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_EMAIL): str,
@@ -54,10 +36,14 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     """
     _LOGGER.info("Starting validate_input...")
     
-    # Create SSL context that matches what worked in testing
-    ssl_context = ssl.create_default_context()
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
-    session = aiohttp.ClientSession(connector=connector)
+    try:
+        from .fermax_api import FermaxBlueAPI, FermaxBlueAuthError, FermaxBlueConnectionError
+    except ImportError as err:
+        _LOGGER.error("Failed to import fermax_api: %s", err)
+        raise CannotConnect from err
+    
+    # Reuse Home Assistant's shared session and its connection pool
+    session = async_get_clientsession(hass)
     
     # Default response in case of any error
     default_response = {
@@ -68,44 +54,22 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     try:
         api = FermaxBlueAPI(data[CONF_EMAIL], data[CONF_PASSWORD], session)
         
-        # First try authentication only
         _LOGGER.info("Starting authentication test...")
-        auth_result = await api.authenticate()
-        if not auth_result:
-            _LOGGER.error("Authentication failed")
-            raise InvalidAuth
-        
-        _LOGGER.info("Authentication successful, testing pairings...")
-        
-        # If auth works, try to get pairings
-        try:
-            await api.get_pairings()
-            home_info = api.get_home_info()
-            title = home_info.get("name", "Fermax Blue Home")
-        except Exception as e:
-            _LOGGER.warning(f"Could not get pairings, using default title: {e}")
-            title = "Fermax Blue Home"
-        
-        result = {
-            "title": title,
-            "home_id": "unknown",
-        }
-        _LOGGER.info(f"Validation successful, returning: {result}")
+        result = await api.login_and_fetch_home()
+        _LOGGER.info("Validation successful, returning: %s", result)
         return result
         
     except FermaxBlueAuthError as err:
-        _LOGGER.error(f"Authentication error: {err}")
+        _LOGGER.error("Authentication error: %s", err)
         raise InvalidAuth
     except FermaxBlueConnectionError as err:
-        _LOGGER.error(f"Connection error: {err}")
+        _LOGGER.error("Connection error: %s", err)
         raise CannotConnect
     except Exception as err:
-        _LOGGER.exception(f"Unexpected exception in validate_input: {err}")
+        _LOGGER.exception("Unexpected exception in validate_input: %s", err)
         # Return default response instead of raising
         _LOGGER.error("Returning default response due to unexpected error")
         return default_response
-    finally:
-        await session.close()
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -120,13 +84,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
         
         if user_input is not None:
+            # Abort duplicates before spending any API round trips on them
+            await self.async_set_unique_id(user_input[CONF_EMAIL])
+            self._abort_if_unique_id_configured()
+            
             try:
                 info = await validate_input(self.hass, user_input)
-                _LOGGER.debug(f"Validation successful, info: {info}")
+                _LOGGER.debug("Validation successful, info: %s", info)
                 
                 # Ensure info is a dict and has title
                 if not isinstance(info, dict):
-                    _LOGGER.error(f"validate_input returned non-dict: {type(info)}")
+                    _LOGGER.error("validate_input returned non-dict: %s", type(info))
                     info = {"title": "Fermax Blue Home", "home_id": "unknown"}
                 
                 if "title" not in info:
@@ -138,16 +106,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
             except Exception as e:
-                _LOGGER.exception(f"Unexpected exception in config flow: {e}")
+                _LOGGER.exception("Unexpected exception in config flow: %s", e)
                 errors["base"] = "unknown"
             else:
-                # Create a unique ID based on email
-                await self.async_set_unique_id(user_input[CONF_EMAIL])
-                self._abort_if_unique_id_configured()
-                
                 # Ensure we have a title
                 title = info.get("title", "Fermax Blue Home")
-                _LOGGER.debug(f"Creating entry with title: {title}")
+                _LOGGER.debug("Creating entry with title: %s", title)
                 
                 return self.async_create_entry(
                     title=title,
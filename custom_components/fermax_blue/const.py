@@ -33,6 +33,10 @@ ENTITY_OPEN_DOOR: Final = "Open Door"
 
 # Default values
 DEFAULT_TIMEOUT: Final = 30
+DEFAULT_SCAN_INTERVAL: Final = 360  # minutes
+MIN_SCAN_INTERVAL: Final = 15  # minutes
+MAX_SCAN_INTERVAL: Final = 1440  # minutes
+SCAN_INTERVAL_JITTER: Final = 60  # seconds
 TOKEN_CACHE_FILE: Final = "fermax_blue_token.json"
 
 # Error messages
@@ -1,21 +1,21 @@
 """Fermax Blue API client."""
 import asyncio
-import json
 import logging
-import ssl
+import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import aiohttp
-import async_timeout
+import orjson
 from aiohttp import ClientConnectorError
+from yarl import URL
 
 from .const import (
     OAUTH_URL,
-    BASE_URL,
-    USER_INFO_URL,
     PAIRINGS_URL,
-    DEVICE_INFO_URL,
     OPEN_DOOR_URL,
     OAUTH_CLIENT_AUTH,
     APP_VERSION,
@@ -27,11 +27,20 @@ from .const import (
     ERROR_INVALID_AUTH,
     ERROR_CANNOT_CONNECT,
     ERROR_TIMEOUT,
-    ERROR_UNKNOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
+# Refresh 5 minutes before expiration to avoid edge cases
+_REFRESH_BUFFER = 300  # seconds
+
+# Success/error indicators in the door-open response body
+# (matched on the raw bytes, so the happy path never decodes the body)
+_DOOR_OK = re.compile(rb"ok|success|open|abierta|abierto|puerta abierta", re.IGNORECASE)
+_DOOR_FAIL = re.compile(rb"ko|error|fail|cerrada|bloqueada", re.IGNORECASE)
+
 
 class FermaxBlueAPIError(Exception):
     """Base exception for Fermax Blue API errors."""
@@ -48,32 +57,70 @@ class FermaxBlueConnectionError(FermaxBlueAPIError):
 class AccessId:
     """Access ID for door control."""
     
+    __slots__ = ("block", "subblock", "number", "_view", "json_body")
+    
     def __init__(self, block: int, subblock: int, number: int):
         self.block = block
         self.subblock = subblock
         self.number = number
-    
-    def to_dict(self) -> Dict[str, int]:
-        """Convert to dictionary for API calls."""
-        return {
-            "block": self.block,
-            "subblock": self.subblock,
-            "number": self.number
+        data = {
+            "block": block,
+            "subblock": subblock,
+            "number": number
         }
+        # Read-only view and serialized door-open body, both built once
+        self._view: Mapping[str, int] = MappingProxyType(data)
+        self.json_body = orjson.dumps(data)
+    
+    def to_dict(self) -> Mapping[str, int]:
+        """Return a read-only mapping for API calls."""
+        return self._view
+    
+    def __repr__(self) -> str:
+        """Return a readable representation for logging."""
+        return f"AccessId(block={self.block}, subblock={self.subblock}, number={self.number})"
+
+
+def _access_id(data: Dict[str, int]) -> AccessId:
+    """Build an AccessId from the accessId object of a pairing door."""
+    return AccessId(
+        block=data.get("block", 0),
+        subblock=data.get("subblock", 0),
+        number=data.get("number", 0),
+    )
+
+
+def _open_door_url(device_id: str) -> URL:
+    """Return the directed door-open URL for a device."""
+    return URL(f"{OPEN_DOOR_URL}/{device_id}/directed-opendoor")
 
 
 class FermaxBlueAPI:
     """Fermax Blue API client."""
 
     def __init__(self, username: str, password: str, session: aiohttp.ClientSession):
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        The session is not owned by the client and is never closed here.
+        Pass a long-lived shared session (the integration's own session or
+        Home Assistant's async_get_clientsession) rather than creating one
+        per client, so connections to Fermax stay pooled.
+        """
         self.username = username
         self.password = password
         self.session = session
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
-        self.token_expires_at: Optional[datetime] = None
+        self._token_expires_at: Optional[datetime] = None
+        # Monotonic deadline mirroring token_expires_at minus the refresh buffer
+        self._refresh_deadline = 0.0
         self.pairings: List[Dict[str, Any]] = []
+        self._home_info: Dict[str, Any] = {}
+        self._door_devices: List[Dict[str, Any]] = []
+        self._pairings_signature: Optional[int] = None
+        self._open_door_urls: Dict[str, URL] = {}
+        self._index_pairings()
+        self._auth_lock = asyncio.Lock()
         self._common_headers = {
             "app-version": APP_VERSION,
             "accept-language": "en-ES;q=1.0, es-ES;q=0.9",
@@ -82,251 +129,356 @@ class FermaxBlueAPI:
             "phone-model": PHONE_MODEL,
             "app-build": APP_BUILD,
         }
+        self._auth_headers = {
+            "Authorization": OAUTH_CLIENT_AUTH,
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        # Form bodies are encoded once; the refresh body follows the refresh token
+        self._password_body = urlencode({
+            "grant_type": "password",
+            "username": username,
+            "password": password,
+        }).encode()
+        self._refresh_body = b""
+        self._refresh_body_token: Optional[str] = None
+        # Rebuilt only when the access token changes
+        self._api_headers: Dict[str, str] = {}
+        self._api_headers_token: Optional[str] = None
+
+    @property
+    def token_expires_at(self) -> Optional[datetime]:
+        """Return when the access token expires."""
+        return self._token_expires_at
+
+    @token_expires_at.setter
+    def token_expires_at(self, expires_at: Optional[datetime]) -> None:
+        """Set the token expiry, also when restored from storage."""
+        self._token_expires_at = expires_at
+        if expires_at is None:
+            self._refresh_deadline = 0.0
+        else:
+            remaining = (expires_at - datetime.now(tz=timezone.utc)).total_seconds()
+            self._refresh_deadline = time.monotonic() + remaining - _REFRESH_BUFFER
 
     def _needs_refresh(self) -> bool:
         """Check if token needs refresh."""
-        if not self.access_token or not self.token_expires_at:
+        if not self.access_token:
             return True
-        # Refresh 5 minutes before expiration to avoid edge cases
-        buffer_time = timedelta(minutes=5)
-        return datetime.now(tz=timezone.utc) >= (self.token_expires_at - buffer_time)
+        return time.monotonic() >= self._refresh_deadline
 
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get headers for OAuth requests."""
-        return {
-            "Authorization": OAUTH_CLIENT_AUTH,
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
+        return self._auth_headers
 
     def _get_api_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            **self._common_headers
-        }
+        if self._api_headers_token != self.access_token:
+            self._api_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+                **self._common_headers
+            }
+            self._api_headers_token = self.access_token
+        return self._api_headers
 
     async def authenticate(self) -> bool:
         """Authenticate with Fermax Blue OAuth."""
+        return await self._password_login()
+
+    async def _password_login(self) -> bool:
+        """Log in with the account password.
+
+        Raises FermaxBlueAuthError for rejected credentials and
+        FermaxBlueConnectionError for network failures. Token renewal
+        calls this directly so subclasses overriding authenticate() cannot
+        turn a network failure into a silent False.
+        """
         try:
-            _LOGGER.debug(f"Authenticating with OAuth URL: {OAUTH_URL}")
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                data = {
-                    "grant_type": "password",
-                    "username": self.username,
-                    "password": self.password,
-                }
-                
-                _LOGGER.debug("Sending OAuth authentication request...")
-                _LOGGER.debug(f"Request data: grant_type=password, username={self.username}")
+            _LOGGER.debug("Authenticating with OAuth URL: %s", OAUTH_URL)
+            _LOGGER.debug("Sending OAuth authentication request...")
+            _LOGGER.debug("Request data: grant_type=password, username=%s", self.username)
+            
+            async with self.session.post(
+                OAUTH_URL,
+                headers=self._get_auth_headers(),
+                data=self._password_body,
+                timeout=_TIMEOUT,
+            ) as response:
+                _LOGGER.debug("OAuth response status: %s", response.status)
                 
-                async with self.session.post(
-                    OAUTH_URL,
-                    headers=self._get_auth_headers(),
-                    data=data
-                ) as response:
-                    _LOGGER.debug(f"OAuth response status: {response.status}")
+                if response.status == 200:
+                    oauth_data = await response.json(loads=orjson.loads)
+                    self.access_token = oauth_data.get("access_token")
+                    self.refresh_token = oauth_data.get("refresh_token")
+                    expires_in = oauth_data.get("expires_in", 3600)
                     
-                    if response.status == 200:
-                        oauth_data = await response.json()
-                        self.access_token = oauth_data.get("access_token")
-                        self.refresh_token = oauth_data.get("refresh_token")
-                        expires_in = oauth_data.get("expires_in", 3600)
-                        
-                        if self.access_token:
-                            self.token_expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
-                            _LOGGER.debug("Authentication successful")
-                            return True
-                        else:
-                            raise FermaxBlueAuthError("No access token received")
-                    elif response.status == 400 or response.status == 401:
-                        error_data = await response.json()
-                        error_desc = error_data.get("error_description", ERROR_INVALID_AUTH)
-                        raise FermaxBlueAuthError(error_desc)
+                    if self.access_token:
+                        self.token_expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
+                        _LOGGER.debug("Authentication successful")
+                        return True
                     else:
-                        error_text = await response.text()
-                        _LOGGER.error(f"Unexpected HTTP status {response.status}: {error_text}")
-                        raise FermaxBlueConnectionError(f"HTTP {response.status}: {error_text}")
-                        
-        except asyncio.TimeoutError:
-            _LOGGER.error(f"Authentication timeout after {DEFAULT_TIMEOUT} seconds")
-            raise FermaxBlueConnectionError(ERROR_TIMEOUT)
+                        raise FermaxBlueAuthError("No access token received")
+                elif response.status == 400 or response.status == 401:
+                    error_data = await response.json(loads=orjson.loads)
+                    error_desc = error_data.get("error_description", ERROR_INVALID_AUTH)
+                    raise FermaxBlueAuthError(error_desc)
+                else:
+                    error_text = await response.text()
+                    _LOGGER.error("Unexpected HTTP status %s: %s", response.status, error_text)
+                    raise FermaxBlueConnectionError(f"HTTP {response.status}: {error_text}")
+                    
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Authentication timeout after %s seconds", DEFAULT_TIMEOUT)
+            raise FermaxBlueConnectionError(ERROR_TIMEOUT) from err
         except ClientConnectorError as err:
-            _LOGGER.error(f"Connection error: {err}")
-            raise FermaxBlueConnectionError(f"Connection failed: {err}")
+            _LOGGER.error("Connection error: %s", err)
+            raise FermaxBlueConnectionError(f"Connection failed: {err}") from err
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"HTTP client error: {err}")
-            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}")
-        except FermaxBlueAPIError:
-            raise
-        except Exception as err:
-            _LOGGER.error(f"Unexpected error during authentication: {type(err).__name__}: {err}")
-            raise FermaxBlueAPIError(f"{ERROR_UNKNOWN}: {err}")
+            _LOGGER.error("HTTP client error: %s", err)
+            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}") from err
 
     async def refresh_auth(self) -> bool:
         """Refresh authentication token."""
         if not self.refresh_token:
             _LOGGER.warning("No refresh token available, performing full authentication")
-            return await self.authenticate()
+            return await self._password_login()
             
         try:
             _LOGGER.debug("Attempting to refresh authentication token")
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                data = {
+            if self._refresh_body_token != self.refresh_token:
+                self._refresh_body = urlencode({
                     "grant_type": "refresh_token",
                     "refresh_token": self.refresh_token,
-                }
-                
-                async with self.session.post(
-                    OAUTH_URL,
-                    headers=self._get_auth_headers(),
-                    data=data
-                ) as response:
-                    if response.status == 200:
-                        oauth_data = await response.json()
-                        self.access_token = oauth_data.get("access_token")
-                        new_refresh_token = oauth_data.get("refresh_token")
-                        if new_refresh_token:
-                            self.refresh_token = new_refresh_token
-                        expires_in = oauth_data.get("expires_in", 3600)
-                        self.token_expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
-                        _LOGGER.debug(f"Token refreshed successfully, expires in {expires_in} seconds")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        _LOGGER.warning(f"Token refresh failed with status {response.status}: {error_text}")
-                        # Refresh failed, try full auth
-                        return await self.authenticate()
-                        
-        except Exception as err:
-            _LOGGER.error(f"Exception during token refresh: {err}")
-            # If refresh fails, try full authentication
-            return await self.authenticate()
+                }).encode()
+                self._refresh_body_token = self.refresh_token
+            
+            async with self.session.post(
+                OAUTH_URL,
+                headers=self._get_auth_headers(),
+                data=self._refresh_body,
+                timeout=_TIMEOUT,
+            ) as response:
+                if response.status == 200:
+                    oauth_data = await response.json(loads=orjson.loads)
+                    self.access_token = oauth_data.get("access_token")
+                    new_refresh_token = oauth_data.get("refresh_token")
+                    if new_refresh_token:
+                        self.refresh_token = new_refresh_token
+                    expires_in = oauth_data.get("expires_in", 3600)
+                    self.token_expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in)
+                    _LOGGER.debug("Token refreshed successfully, expires in %s seconds", expires_in)
+                    return True
+                else:
+                    error_text = await response.text()
+                    _LOGGER.warning("Token refresh failed with status %s: %s", response.status, error_text)
+                    
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Token refresh timeout after %s seconds", DEFAULT_TIMEOUT)
+            raise FermaxBlueConnectionError(ERROR_TIMEOUT) from err
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error during token refresh: %s", err)
+            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}") from err
+        
+        # The refresh token was rejected, fall back to a password login
+        return await self._password_login()
 
     async def _ensure_auth(self) -> bool:
         """Ensure we have a valid auth token."""
-        if self._needs_refresh():
+        if not self._needs_refresh():
+            return True
+        # Concurrent callers wait here and reuse the token the first one obtained
+        async with self._auth_lock:
+            if not self._needs_refresh():
+                return True
             _LOGGER.debug("Token needs refresh")
             if self.refresh_token:
                 if not await self.refresh_auth():
                     _LOGGER.error("Failed to refresh authentication")
                     raise FermaxBlueAuthError("Failed to refresh authentication")
             else:
-                if not await self.authenticate():
+                if not await self._password_login():
                     _LOGGER.error("Failed to authenticate")
                     raise FermaxBlueAuthError("Failed to authenticate")
         return True
 
-    async def get_pairings(self) -> List[Dict[str, Any]]:
-        """Get list of paired devices."""
+    async def ensure_auth(self) -> bool:
+        """Make sure a valid token is available, renewing it if needed.
+
+        Raises FermaxBlueAuthError when neither the refresh token nor a
+        password login yields a new token, and FermaxBlueConnectionError
+        when the OAuth server cannot be reached.
+        """
+        return await self._ensure_auth()
+
+    async def _refresh_rejected(self, rejected_token: Optional[str]) -> bool:
+        """Refresh the token after a 401 unless a concurrent caller already did."""
+        async with self._auth_lock:
+            if self.access_token != rejected_token:
+                return True
+            return await self.refresh_auth()
+
+    async def _get_json(self, url: str, action: str) -> Any:
+        """GET a JSON resource, refreshing the token and retrying once on 401."""
         await self._ensure_auth()
         
         try:
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
+            for attempt in range(2):
+                token = self.access_token
                 async with self.session.get(
-                    PAIRINGS_URL,
-                    headers=self._get_api_headers()
+                    url,
+                    headers=self._get_api_headers(),
+                    timeout=_TIMEOUT,
                 ) as response:
                     if response.status == 200:
-                        self.pairings = await response.json()
-                        _LOGGER.debug(f"Found {len(self.pairings)} pairings")
-                        return self.pairings
-                    elif response.status == 401:
-                        _LOGGER.warning("Authentication expired while getting pairings, refreshing...")
-                        # Token expired, refresh and retry
-                        if await self.refresh_auth():
-                            return await self.get_pairings()
-                        else:
-                            raise FermaxBlueAuthError("Failed to refresh authentication")
-                    else:
+                        return await response.json(loads=orjson.loads)
+                    if response.status != 401:
                         error_text = await response.text()
-                        _LOGGER.error(f"Failed to get pairings: HTTP {response.status}: {error_text}")
+                        _LOGGER.error("Failed %s: HTTP %s: %s", action, response.status, error_text)
                         raise FermaxBlueConnectionError(f"HTTP {response.status}: {error_text}")
+                
+                if attempt == 0:
+                    _LOGGER.warning("Authentication expired while %s, refreshing...", action)
+                    if not await self._refresh_rejected(token):
+                        raise FermaxBlueAuthError("Failed to refresh authentication")
+            
+            raise FermaxBlueAuthError("Authentication rejected after token refresh")
                         
-        except asyncio.TimeoutError:
-            _LOGGER.error(f"Get pairings timeout after {DEFAULT_TIMEOUT} seconds")
-            raise FermaxBlueConnectionError(ERROR_TIMEOUT)
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Timeout %s after %s seconds", action, DEFAULT_TIMEOUT)
+            raise FermaxBlueConnectionError(ERROR_TIMEOUT) from err
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Network error getting pairings: {err}")
-            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}")
-        except FermaxBlueAPIError:
-            raise
-        except Exception as err:
-            _LOGGER.error(f"Unexpected error getting pairings: {type(err).__name__}: {err}")
-            raise FermaxBlueAPIError(f"{ERROR_UNKNOWN}: {err}")
+            _LOGGER.error("Network error %s: %s", action, err)
+            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}") from err
+
+    async def get_pairings(self) -> List[Dict[str, Any]]:
+        """Get list of paired devices."""
+        self.pairings = await self._get_json(PAIRINGS_URL, "getting pairings")
+        self._index_pairings()
+        _LOGGER.debug("Found %s pairings", len(self.pairings))
+        return self.pairings
 
     async def open_door(self, device_id: str, access_id: AccessId) -> bool:
         """Open a door using device ID and access ID."""
         await self._ensure_auth()
-        
+        return await self._open_door_raw(device_id, access_id)
+
+    async def open_doors(
+        self, targets: List[Tuple[str, AccessId]]
+    ) -> List[Union[bool, BaseException]]:
+        """Open several doors concurrently.
+
+        Authentication is checked once up front. Results are returned in
+        the order of ``targets``; a failed door yields its exception.
+        """
+        await self._ensure_auth()
+        return await asyncio.gather(
+            *(self._open_door_raw(device_id, access_id) for device_id, access_id in targets),
+            return_exceptions=True,
+        )
+
+    async def _open_door_raw(self, device_id: str, access_id: AccessId) -> bool:
+        """POST a door-open command, assuming the token was already checked."""
         try:
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                url = f"{OPEN_DOOR_URL}/{device_id}/directed-opendoor"
-                data = json.dumps(access_id.to_dict())
-                
-                _LOGGER.debug(f"Opening door: device_id={device_id}, access_id={access_id.to_dict()}")
-                
+            url = self._open_door_urls.get(device_id) or _open_door_url(device_id)
+            data = access_id.json_body
+            
+            _LOGGER.debug("Opening door: device_id=%s, access_id=%s", device_id, access_id)
+            
+            for attempt in range(2):
+                token = self.access_token
                 async with self.session.post(
                     url,
                     headers=self._get_api_headers(),
-                    data=data
+                    data=data,
+                    timeout=_TIMEOUT,
                 ) as response:
-                    result_text = await response.text()
-                    _LOGGER.debug(f"Door open response: status={response.status}, body={result_text}")
+                    # Read the whole body so the connection can go back to the pool
+                    result = await response.read()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Door open response: status=%s, body=%s",
+                            response.status,
+                            result.decode("utf-8", "replace"),
+                        )
                     
                     if response.status == 200:
                         # Check if response contains success indicator
-                        result_lower = result_text.lower()
-                        success_indicators = ["ok", "success", "open", "abierta", "abierto", "puerta abierta"]
-                        if any(indicator in result_lower for indicator in success_indicators):
-                            _LOGGER.info(f"Door opened successfully: {result_text}")
+                        if _DOOR_OK.search(result):
+                            _LOGGER.info("Door opened successfully on %s", device_id)
                             return True
+                        elif _DOOR_FAIL.search(result):
+                            _LOGGER.error("Door open failed per response: %s", result.decode("utf-8", "replace"))
+                            return False
                         else:
-                            _LOGGER.warning(f"Door command sent but unclear response: {result_text}")
+                            _LOGGER.warning("Door command sent but unclear response: %s", result.decode("utf-8", "replace"))
                             # Still return True if we got 200 status but log the unusual response
                             return True
-                    elif response.status == 401:
-                        _LOGGER.warning("Authentication expired during door open, refreshing...")
-                        if await self.refresh_auth():
-                            return await self.open_door(device_id, access_id)
-                        else:
-                            _LOGGER.error("Failed to refresh authentication for door open")
-                            raise FermaxBlueAuthError("Authentication failed")
-                    else:
-                        _LOGGER.error(f"Failed to open door: HTTP {response.status}: {result_text}")
+                    if response.status != 401:
+                        result_text = result.decode("utf-8", "replace")
+                        _LOGGER.error("Failed to open door: HTTP %s: %s", response.status, result_text)
                         raise FermaxBlueAPIError(f"Door open failed with status {response.status}: {result_text}")
-                        
-        except asyncio.TimeoutError:
-            _LOGGER.error(f"Door open timeout after {DEFAULT_TIMEOUT} seconds")
-            raise FermaxBlueConnectionError(ERROR_TIMEOUT)
+                
+                # Refresh the token once and retry; a second 401 is final
+                if attempt == 0:
+                    _LOGGER.warning("Authentication expired during door open, refreshing...")
+                    if not await self._refresh_rejected(token):
+                        _LOGGER.error("Failed to refresh authentication for door open")
+                        raise FermaxBlueAuthError("Authentication failed")
+            
+            raise FermaxBlueAuthError("Authentication rejected after token refresh")
+                    
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Door open timeout after %s seconds", DEFAULT_TIMEOUT)
+            raise FermaxBlueConnectionError(ERROR_TIMEOUT) from err
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Network error during door open: {err}")
-            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}")
-        except FermaxBlueAPIError:
-            raise
-        except Exception as err:
-            _LOGGER.error(f"Unexpected error during door open: {type(err).__name__}: {err}")
-            raise FermaxBlueAPIError(f"{ERROR_UNKNOWN}: {err}")
-
-    async def test_connection(self) -> bool:
-        """Test connection to Fermax Blue API."""
+            _LOGGER.error("Network error during door open: %s", err)
+            raise FermaxBlueConnectionError(f"{ERROR_CANNOT_CONNECT}: {err}") from err
+
+    async def login_and_fetch_home(self) -> Dict[str, str]:
+        """Authenticate and return the entry title and home ID in one call."""
+        if not await self.authenticate():
+            raise FermaxBlueAuthError(ERROR_INVALID_AUTH)
+        
+        # The home name only sets the entry title, so a failure here is not fatal
         try:
-            _LOGGER.info(f"Testing connection for user: {self.username}")
-            await self.authenticate()
-            _LOGGER.info("Authentication successful, getting pairings...")
             await self.get_pairings()
-            _LOGGER.info(f"Connection test successful, found {len(self.pairings)} pairings")
-            return True
-        except Exception as err:
-            _LOGGER.error(f"Connection test failed: {err}")
-            _LOGGER.exception("Full traceback:")
-            return False
+        except FermaxBlueAPIError as err:
+            _LOGGER.warning("Could not get pairings, using default title: %s", err)
+        
+        home_info = self.get_home_info()
+        return {
+            "title": home_info.get("name", "Fermax Blue Home"),
+            "home_id": home_info.get("id", "unknown"),
+        }
 
     def get_home_info(self) -> Dict[str, Any]:
         """Get home information from pairings."""
+        return self._home_info
+
+    def get_door_devices(self) -> List[Dict[str, Any]]:
+        """Get door devices from pairings."""
+        return self._door_devices
+
+    def _index_pairings(self) -> None:
+        """Derive home info and door devices, only when the pairings changed."""
+        signature = hash(orjson.dumps(self.pairings, option=orjson.OPT_SORT_KEYS))
+        if signature == self._pairings_signature:
+            return
+        self._pairings_signature = signature
+        self._home_info = self._build_home_info()
+        self._door_devices = self._build_door_devices()
+        # Parsed once per device instead of on every door press
+        self._open_door_urls = {
+            device_id: _open_door_url(device_id)
+            for device_id in {pairing.get("deviceId") for pairing in self.pairings}
+            if device_id
+        }
+
+    def _build_home_info(self) -> Dict[str, Any]:
+        """Build home information from pairings."""
         if not self.pairings:
             return {
                 "id": "unknown",
@@ -342,31 +494,27 @@ class FermaxBlueAPI:
             "address": first_pairing.get("address", ""),
         }
 
-    def get_door_devices(self) -> List[Dict[str, Any]]:
-        """Get door devices from pairings."""
+    def _build_door_devices(self) -> List[Dict[str, Any]]:
+        """Build door devices from pairings."""
         doors = []
         
         for pairing in self.pairings:
             device_id = pairing.get("deviceId")
-            access_door_map = pairing.get("accessDoorMap", {})
+            pairing_tag = pairing.get("tag", "")
+            home = pairing.get("home", "")
             
-            # Each access door in the map is a door we can control
-            for door_key, door_data in access_door_map.items():
-                if door_data.get("visible", True):
-                    access_id_data = door_data.get("accessId", {})
-                    access_id = AccessId(
-                        block=access_id_data.get("block", 0),
-                        subblock=access_id_data.get("subblock", 0),
-                        number=access_id_data.get("number", 0)
-                    )
-                    
-                    doors.append({
-                        "id": f"{device_id}_{door_key}",
-                        "name": door_data.get("title", f"Door {door_key}"),
-                        "device_id": device_id,
-                        "access_id": access_id,
-                        "pairing_tag": pairing.get("tag", ""),
-                        "home": pairing.get("home", ""),
-                    })
+            # Each visible access door in the map is a door we can control
+            doors.extend(
+                {
+                    "id": f"{device_id}_{door_key}",
+                    "name": door_data.get("title", f"Door {door_key}"),
+                    "device_id": device_id,
+                    "access_id": _access_id(door_data.get("accessId", {})),
+                    "pairing_tag": pairing_tag,
+                    "home": home,
+                }
+                for door_key, door_data in pairing.get("accessDoorMap", {}).items()
+                if door_data.get("visible", True)
+            )
         
         return doors
\ No newline at end of file